@@ -6,8 +6,15 @@
 
 from .delta import Delta
 from .diff import hello, trim_whitespace, find_duplicates, duplicates
-from .io import read_csv, write_csv, read_excel, write_excel
-from .quality import audit_dataframe
+from .io import (
+    read_csv,
+    write_csv,
+    read_excel,
+    write_excel,
+    read_parquet,
+    write_parquet,
+)
+from .quality import audit_dataframe, compile_audit
 from .check import expect_df
 from .__about__ import __version__
 
@@ -18,9 +25,12 @@ __all__ = [
     "duplicates",
     "find_duplicates",
     "audit_dataframe",
+    "compile_audit",
     "expect_df",
     "read_csv",
     "write_csv",
     "read_excel",
     "write_excel",
+    "read_parquet",
+    "write_parquet",
 ]
@@ -9,12 +9,29 @@ describe which expectations passed or failed.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 import re
 from typing import Callable, Iterable
 
 import numpy as np
 import pandas as pd
 
+# Parsing patterns, compiled once at import instead of per expectation token.
+# Row-rule and column expectations share one alternation so each line is
+# scanned by the regex engine exactly once.
+_LINE_RE = re.compile(
+    r"(?P<row>^(?:rows must|every row must|expect rows))"
+    r"|(?:expect\s+)?column\s+(?P<name>[\w .-]+?)(?:\s*(?:to|:)?\s+)(?P<body>.+)",
+    re.IGNORECASE,
+)
+_TOKEN_SPLIT_RE = re.compile(r"[,;]|\band\b", re.IGNORECASE)
+_FORMAT_RE = re.compile(r"format\s+(.+)", re.IGNORECASE)
+_ALLOWED_VALUES_RE = re.compile(r"allowed values?[^\w]*(.+)", re.IGNORECASE)
+_VALUES_IN_RE = re.compile(r"values?\s+in\s+(.+)", re.IGNORECASE)
+_ALLOWED_TAIL_SPLIT_RE = re.compile(r";|\band\b", re.IGNORECASE)
+_REGEX_RE = re.compile(r"regex\s+(.+)", re.IGNORECASE)
+_MATCHES_RE = re.compile(r"match(?:es)?\s+(.+)", re.IGNORECASE)
+
 
 @dataclass
 class ColumnExpectation:
@@ -32,7 +49,7 @@ class ColumnExpectation:
     fmt:
         Expected ``strftime`` format for datetime/text parsing.
     allowed_values:
-        Optional allowed set of values.
+        Optional allowed set of values (frozen so it hashes once).
     regex:
         Optional regular expression pattern that values must match.
     allow_nulls:
@@ -43,7 +60,7 @@ class ColumnExpectation:
     unique: bool = False
     dtype: str | None = None
     fmt: str | None = None
-    allowed_values: set[str] | None = None
+    allowed_values: frozenset[str] | None = None
     regex: str | None = None
     allow_nulls: bool | None = None
 
@@ -165,27 +182,33 @@ def _parse_expectations(
     expectations: str | Iterable[str],
 ) -> tuple[list[ColumnExpectation], list[RowRule]]:
     if isinstance(expectations, str):
-        lines = [line.strip() for line in expectations.splitlines() if line.strip()]
+        lines = tuple(line.strip() for line in expectations.splitlines() if line.strip())
     else:
-        lines = [str(item).strip() for item in expectations if str(item).strip()]
+        lines = tuple(str(item).strip() for item in expectations if str(item).strip())
+
+    column_expectations, row_rules = _parse_expectation_lines(lines)
+    # Return fresh lists: callers extend them, and the cached tuples (plus the
+    # parsed objects, which are never mutated after construction) are shared
+    # across calls.
+    return list(column_expectations), list(row_rules)
 
+
+@lru_cache(maxsize=256)
+def _parse_expectation_lines(
+    lines: tuple[str, ...],
+) -> tuple[tuple[ColumnExpectation, ...], tuple[RowRule, ...]]:
     column_expectations: list[ColumnExpectation] = []
     row_rules: list[RowRule] = []
 
     for line in lines:
-        lowered = line.lower()
-        if lowered.startswith(("rows must", "every row must", "expect rows")):
+        match = _LINE_RE.search(line)
+        if match and match.group("row") is not None:
             row_rules.extend(_parse_row_rules([line]))
             continue
 
-        column_match = re.search(
-            r"(?:expect\s+)?column\s+(?P<name>[\w .-]+?)(?:\s*(?:to|:)?\s+)(?P<body>.+)",
-            line,
-            flags=re.IGNORECASE,
-        )
-        if column_match:
-            name = column_match.group("name").strip()
-            body = column_match.group("body").strip()
+        if match:
+            name = match.group("name").strip()
+            body = match.group("body").strip()
         elif ":" in line:
             name, body = [segment.strip() for segment in line.split(":", maxsplit=1)]
             name = name.replace("column", "", 1).strip()
@@ -196,7 +219,7 @@ def _parse_expectations(
         expectation = _parse_column_body(name, body)
         column_expectations.append(expectation)
 
-    return column_expectations, row_rules
+    return tuple(column_expectations), tuple(row_rules)
 
 
 def _parse_column_body(name: str, body: str) -> ColumnExpectation:
@@ -206,7 +229,7 @@ def _parse_column_body(name: str, body: str) -> ColumnExpectation:
     if allowed_from_full_body:
         expectation.allowed_values = allowed_from_full_body
 
-    tokens = re.split(r"[,;]|\band\b", body, flags=re.IGNORECASE)
+    tokens = _TOKEN_SPLIT_RE.split(body)
     for raw_token in tokens:
         token = raw_token.strip()
         lowered = token.lower()
@@ -251,21 +274,21 @@ def _extract_dtype(token: str) -> str | None:
 
 
 def _extract_format(token: str) -> str | None:
-    match = re.search(r"format\s+(.+)", token, flags=re.IGNORECASE)
+    match = _FORMAT_RE.search(token)
     if match:
         return match.group(1).strip()
     return None
 
 
-def _extract_allowed_values(token: str) -> set[str] | None:
-    match = re.search(r"allowed values?[^\w]*(.+)", token, flags=re.IGNORECASE)
+def _extract_allowed_values(token: str) -> frozenset[str] | None:
+    match = _ALLOWED_VALUES_RE.search(token)
     if not match:
-        match = re.search(r"values?\s+in\s+(.+)", token, flags=re.IGNORECASE)
+        match = _VALUES_IN_RE.search(token)
     if not match:
         return None
 
     values_part = match.group(1).strip()
-    values_part = re.split(r";|\band\b", values_part, maxsplit=1, flags=re.IGNORECASE)[0].strip()
+    values_part = _ALLOWED_TAIL_SPLIT_RE.split(values_part, maxsplit=1)[0].strip()
     values_part = values_part.strip("{}[]()")
     raw_values = [part.strip() for part in values_part.split("or")]
     values: list[str] = []
@@ -275,15 +298,15 @@ def _extract_allowed_values(token: str) -> set[str] | None:
         values.extend([segment.strip().strip("'\"") for segment in raw.split(",") if segment.strip()])
 
     if values:
-        return set(values)
+        return frozenset(values)
     return None
 
 
 def _extract_regex(token: str) -> str | None:
-    match = re.search(r"regex\s+(.+)", token, flags=re.IGNORECASE)
+    match = _REGEX_RE.search(token)
     if match:
         return match.group(1).strip()
-    match = re.search(r"match(?:es)?\s+(.+)", token, flags=re.IGNORECASE)
+    match = _MATCHES_RE.search(token)
     if match:
         return match.group(1).strip()
     return None
@@ -306,6 +329,19 @@ def _parse_row_rules(rules: Iterable[str]) -> list[RowRule]:
     return parsed
 
 
+_MAX_REPORTED_ROWS = 100
+
+
+def _row_list(index: pd.Index) -> str:
+    """Render a failing-row index for a diagnostic, capped to keep the
+    message (and the list materialization) bounded on huge columns."""
+
+    head = index[:_MAX_REPORTED_ROWS].tolist()
+    if len(index) > _MAX_REPORTED_ROWS:
+        return f"{head} (+{len(index) - _MAX_REPORTED_ROWS} more)"
+    return str(head)
+
+
 def _validate_column(df: pd.DataFrame, expectation: ColumnExpectation) -> ColumnResult:
     diagnostics: list[str] = []
 
@@ -314,51 +350,80 @@ def _validate_column(df: pd.DataFrame, expectation: ColumnExpectation) -> Column
         return ColumnResult(column=expectation.name, passed=False, diagnostics=diagnostics)
 
     series = df[expectation.name]
+    if series.empty:
+        return ColumnResult(column=expectation.name, passed=True, diagnostics=diagnostics)
 
     if expectation.allow_nulls is False:
         null_mask = series.isna()
         if null_mask.any():
-            indices = list(series.index[null_mask])
-            diagnostics.append(f"nulls forbidden; rows {indices}")
+            diagnostics.append(f"nulls forbidden; rows {_row_list(series.index[null_mask])}")
 
-    if expectation.unique:
+    # Series.is_unique exits on the first duplicate, so the full
+    # duplicated(keep=False) mask is only built when something is wrong.
+    if expectation.unique and not series.is_unique:
         duplicates = series[series.duplicated(keep=False)]
-        if not duplicates.empty:
-            duplicate_indices = list(duplicates.index)
-            samples = duplicates.head(5).tolist()
-            diagnostics.append(
-                f"expected unique values; duplicate rows {duplicate_indices}; samples: {samples}"
-            )
+        samples = duplicates.head(5).tolist()
+        diagnostics.append(
+            f"expected unique values; duplicate rows {_row_list(duplicates.index)}; samples: {samples}"
+        )
 
     if expectation.dtype:
         dtype_diagnostics = _dtype_diagnostics(series, expectation)
         diagnostics.extend(dtype_diagnostics)
 
     if expectation.allowed_values:
-        invalid_mask = series.notna() & ~series.astype(str).isin(expectation.allowed_values)
+        invalid_mask = series.notna() & _disallowed_mask(series, expectation.allowed_values)
         if invalid_mask.any():
             invalid = series[invalid_mask]
             diagnostics.append(
-                f"unexpected values; rows {list(invalid.index)}; samples: {invalid.astype(str).head(5).tolist()}"
+                f"unexpected values; rows {_row_list(invalid.index)}; samples: {invalid.astype(str).head(5).tolist()}"
             )
 
     if expectation.regex:
-        pattern = re.compile(expectation.regex)
         str_values = series.dropna().astype(str)
-        invalid_mask = ~str_values.map(lambda value: bool(pattern.fullmatch(value)))
+        # str.fullmatch runs the compiled pattern in a C loop instead of a
+        # Python lambda per row.
+        invalid_mask = ~str_values.str.fullmatch(expectation.regex, na=False)
         if invalid_mask.any():
             invalid = str_values[invalid_mask]
             diagnostics.append(
-                f"regex mismatch /{expectation.regex}/; rows {list(invalid.index)}; samples: {invalid.head(5).tolist()}"
+                f"regex mismatch /{expectation.regex}/; rows {_row_list(invalid.index)}; samples: {invalid.head(5).tolist()}"
             )
 
     passed = not diagnostics
     return ColumnResult(column=expectation.name, passed=passed, diagnostics=diagnostics)
 
 
+def _disallowed_mask(series: pd.Series, allowed: frozenset[str]) -> pd.Series:
+    """Mask of values outside *allowed*, avoiding the str cast when possible."""
+
+    if series.dtype != object:
+        if pd.api.types.is_string_dtype(series.dtype):
+            return ~series.isin(allowed)
+        try:
+            coerced = {series.dtype.type(value) for value in allowed}
+        except (TypeError, ValueError):
+            pass
+        else:
+            return ~series.isin(coerced)
+    # Object columns may mix types, so keep the stringified comparison.
+    return ~series.astype(str).isin(allowed)
+
+
 def _dtype_diagnostics(series: pd.Series, expectation: ColumnExpectation) -> list[str]:
     diagnostics: list[str] = []
     dtype = expectation.dtype
+
+    # Columns whose dtype already satisfies the expectation cannot contain a
+    # mismatching value, so skip the coercion passes entirely.
+    actual = series.dtype
+    if (
+        (dtype == "integer" and pd.api.types.is_integer_dtype(actual))
+        or (dtype == "float" and pd.api.types.is_numeric_dtype(actual))
+        or (dtype == "datetime" and pd.api.types.is_datetime64_any_dtype(actual))
+    ):
+        return diagnostics
+
     if dtype == "integer":
         converted = pd.to_numeric(series, errors="coerce")
         fractional = (converted % 1).fillna(0)
@@ -367,7 +432,14 @@ def _dtype_diagnostics(series: pd.Series, expectation: ColumnExpectation) -> lis
         converted = pd.to_numeric(series, errors="coerce")
         invalid_mask = series.notna() & converted.isna()
     elif dtype == "string":
-        invalid_mask = series.notna() & ~series.map(lambda value: isinstance(value, str))
+        if series.dtype != object and pd.api.types.is_string_dtype(series.dtype):
+            # String-dtype columns cannot hold non-strings; nothing to scan.
+            return diagnostics
+        values = series.to_numpy()
+        is_str = np.fromiter(
+            (type(value) is str for value in values), dtype=bool, count=len(values)
+        )
+        invalid_mask = series.notna() & pd.Series(~is_str, index=series.index)
     elif dtype == "datetime":
         parsed = pd.to_datetime(series, format=expectation.fmt, errors="coerce")
         invalid_mask = series.notna() & parsed.isna()
@@ -376,16 +448,41 @@ def _dtype_diagnostics(series: pd.Series, expectation: ColumnExpectation) -> lis
 
     if invalid_mask.any():
         invalid = series[invalid_mask]
-        details = f"expected {dtype}; rows {list(invalid.index)}; samples: {invalid.astype(str).head(5).tolist()}"
+        details = f"expected {dtype}; rows {_row_list(invalid.index)}; samples: {invalid.astype(str).head(5).tolist()}"
         if dtype == "datetime" and expectation.fmt:
             details += f"; format={expectation.fmt}"
         diagnostics.append(details)
     return diagnostics
 
 
+try:
+    import numexpr  # noqa: F401
+except ImportError:  # pragma: no cover - optional accelerator
+    _HAS_NUMEXPR = False
+else:
+    _HAS_NUMEXPR = True
+
+
+def _eval_expression(df: pd.DataFrame, expression: str) -> object:
+    """Evaluate a row-rule expression, preferring the numexpr engine.
+
+    numexpr fuses the arithmetic into a single pass over the columns instead
+    of materializing one temporary Series per operator. Expressions it cannot
+    handle (string comparisons, method calls, ...) fall back to pandas'
+    default engine.
+    """
+
+    if _HAS_NUMEXPR:
+        try:
+            return df.eval(expression, engine="numexpr")
+        except (NotImplementedError, TypeError, ValueError):
+            pass
+    return df.eval(expression)
+
+
 def _validate_row_rule(df: pd.DataFrame, rule: RowRule) -> RowRuleResult:
     try:
-        evaluated = df.eval(rule.expression)
+        evaluated = _eval_expression(df, rule.expression)
     except Exception as exc:  # pragma: no cover - rare parse errors
         return RowRuleResult(
             description=rule.description,
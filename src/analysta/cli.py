@@ -6,11 +6,25 @@ from .delta import Delta
 
 app = typer.Typer(help="Analysta: DataFrame Toolkit for Analysts")
 
+
+def _read_csv(path: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read a CSV with the multithreaded pyarrow engine when available."""
+    kwargs = {"usecols": usecols} if usecols else {}
+    try:
+        return pd.read_csv(path, engine="pyarrow", **kwargs)
+    except (ImportError, ValueError):
+        # pyarrow missing, or the file needs an option pyarrow cannot handle.
+        return pd.read_csv(path, **kwargs)
+
+
 @app.command()
 def diff(
     file_a: Path = typer.Argument(..., help="Path to the first CSV file"),
     file_b: Path = typer.Argument(..., help="Path to the second CSV file"),
     keys: List[str] = typer.Option(..., "--key", "-k", help="Key column(s) to join on"),
+    columns: Optional[List[str]] = typer.Option(
+        None, "--column", "-c", help="Compare only these columns (plus the keys)"
+    ),
     out: Optional[Path] = typer.Option(None, "--out", "-o", help="Path to save HTML report"),
     abs_tol: float = typer.Option(0.0, help="Absolute tolerance for numeric comparison"),
     rel_tol: float = typer.Option(0.0, help="Relative tolerance for numeric comparison"),
@@ -25,8 +39,12 @@ def diff(
         typer.echo(f"Error: {file_b} not found", err=True)
         raise typer.Exit(code=1)
 
-    df_a = pd.read_csv(file_a)
-    df_b = pd.read_csv(file_b)
+    usecols = None
+    if columns:
+        usecols = keys + [c for c in columns if c not in keys]
+
+    df_a = _read_csv(file_a, usecols)
+    df_b = _read_csv(file_b, usecols)
 
     # Validate keys
     for k in keys:
@@ -4,69 +4,37 @@ Copyright (c) 2025  MIT License
 """
 from __future__ import annotations
 
+from functools import cached_property
+from typing import Any
+
 from .diff import trim_whitespace
 
+import numpy as np
 import pandas as pd
 
-
-class Delta:  # pylint: disable=too-few-public-methods
-    """
-    Compare two DataFrames on one or many key columns.
-
-    Parameters
-    ----------
-    df_a, df_b : pandas.DataFrame
-        DataFrames to compare.
-    keys : str | list[str]
-        Column(s) that uniquely identify each row.
-    abs_tol, rel_tol : float, default 0
-        Absolute / relative numeric tolerance when checking for equality.
-    """
-
-    def __init__(
-        self,
-        df_a: pd.DataFrame,
-        df_b: pd.DataFrame,
-        keys: str | list[str],
-        *,
-        abs_tol: float = 0.0,
-        rel_tol: float = 0.0,
-    ) -> None:
-        self.df_a = trim_whitespace(df_a.copy())
-        self.df_b = trim_whitespace(df_b.copy())
-        self.keys = [keys] if isinstance(keys, str) else list(keys)
-        self.abs_tol = abs_tol
-        self.rel_tol = rel_tol
-
-        self._build_diff_frames()
-
-    # --------------------------------------------------------------------- #
-    # Public attributes filled by _build_diff_frames()
-    #
-    unmatched_a: pd.DataFrame  # rows in A but not in B
-    unmatched_b: pd.DataFrame  # rows in B but not in A
-    mismatches: pd.DataFrame   # aligned rows whose non-key columns differ
-    # --------------------------------------------------------------------- #
-
-    # ------------------------ public helpers ----------------------------- #
-    def changed(self, column: str) -> pd.DataFrame:
-        """Return rows where *column* differs between A and B."""
-        col_a = f"{column}_a"
-        col_b = f"{column}_b"
-        return self.mismatches[self.keys + [col_a, col_b]]
-
-    def to_html(self, path: str | None = None) -> str | None:
-        """
-        Generate an HTML report of the comparison.
-
-        Parameters
-        ----------
-        path : str, optional
-            File path to save the HTML report. If None, returns the HTML string.
-        """
-        from jinja2 import Template
-
-        template_str = """
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional accelerator
+    _numba_diff_rows = None
+else:
+
+    @njit(parallel=True, cache=True)
+    def _numba_diff_rows(
+        values_a: np.ndarray, values_b: np.ndarray, abs_tol: float, rel_tol: float
+    ) -> np.ndarray:  # pragma: no cover - exercised only when numba is present
+        rows, cols = values_a.shape
+        out = np.zeros(rows, dtype=np.bool_)
+        for i in prange(rows):
+            for j in range(cols):
+                delta = abs(values_a[i, j] - values_b[i, j])
+                # "not <=" (rather than ">") keeps NaN cells flagged as diffs.
+                if not delta <= abs_tol + rel_tol * abs(values_b[i, j]):
+                    out[i] = True
+                    break
+        return out
+
+
+_TEMPLATE_STR = """
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -313,8 +281,77 @@ class Delta:  # pylint: disable=too-few-public-methods
         </html>
         """
 
-        template = Template(template_str)
-        html = template.render(
+_report_template_cache = None
+
+
+def _report_template():
+    """Compile the report template once per process."""
+    global _report_template_cache
+    if _report_template_cache is None:
+        from jinja2 import Template
+
+        _report_template_cache = Template(_TEMPLATE_STR)
+    return _report_template_cache
+
+
+class Delta:  # pylint: disable=too-few-public-methods
+    """
+    Compare two DataFrames on one or many key columns.
+
+    Parameters
+    ----------
+    df_a, df_b : pandas.DataFrame
+        DataFrames to compare.
+    keys : str | list[str]
+        Column(s) that uniquely identify each row.
+    abs_tol, rel_tol : float, default 0
+        Absolute / relative numeric tolerance when checking for equality.
+    """
+
+    def __init__(
+        self,
+        df_a: pd.DataFrame,
+        df_b: pd.DataFrame,
+        keys: str | list[str],
+        *,
+        abs_tol: float = 0.0,
+        rel_tol: float = 0.0,
+    ) -> None:
+        # No defensive copy needed: trim_whitespace never mutates its input —
+        # it returns a shallow copy that only replaces the text columns it
+        # actually strips (or the original frame when there are none).
+        self.df_a = trim_whitespace(df_a)
+        self.df_b = trim_whitespace(df_b)
+        self.keys = [keys] if isinstance(keys, str) else list(keys)
+        self.abs_tol = abs_tol
+        self.rel_tol = rel_tol
+
+        self._partition_keys()
+
+    # --------------------------------------------------------------------- #
+    # Public frames, built lazily on first access:
+    #   unmatched_a — rows in A but not in B
+    #   unmatched_b — rows in B but not in A
+    #   mismatches  — aligned rows whose non-key columns differ
+    # --------------------------------------------------------------------- #
+
+    # ------------------------ public helpers ----------------------------- #
+    def changed(self, column: str) -> pd.DataFrame:
+        """Return rows where *column* differs between A and B."""
+        col_a = f"{column}_a"
+        col_b = f"{column}_b"
+        return self.mismatches[self.keys + [col_a, col_b]]
+
+    def to_html(self, path: str | None = None) -> str | None:
+        """
+        Generate an HTML report of the comparison.
+
+        Parameters
+        ----------
+        path : str, optional
+            File path to save the HTML report. If None, returns the HTML string.
+        """
+        html = _report_template().render(
             unmatched_a_count=len(self.unmatched_a),
             unmatched_b_count=len(self.unmatched_b),
             mismatches_count=len(self.mismatches),
@@ -331,36 +368,148 @@ class Delta:  # pylint: disable=too-few-public-methods
 
 
     # ------------------------ internal logic ----------------------------- #
-    def _build_diff_frames(self) -> None:
-        # Outer merge tells us where rows exist
-        merged = self.df_a.merge(
-            self.df_b,
-            on=self.keys,
-            how="outer",
-            suffixes=("_a", "_b"),
-            indicator=True,
+    def _key_index(self, df: pd.DataFrame) -> pd.Index:
+        """Hashable index over the key column(s) of *df*."""
+        if len(self.keys) == 1:
+            return pd.Index(df[self.keys[0]])
+        return pd.MultiIndex.from_frame(df[self.keys])
+
+    def _partition_keys(self) -> None:
+        # Partition rows by hash-based key membership instead of a full outer
+        # merge: the unmatched rows never pay for the wide suffixed frame, and
+        # only the intersection is actually aligned column-by-column. Nothing
+        # heavier than these masks is computed until a frame is accessed.
+        a_keys = self._key_index(self.df_a)
+        b_keys = self._key_index(self.df_b)
+        self._in_b = a_keys.isin(b_keys)
+        self._in_a = b_keys.isin(a_keys)
+        self._only_a = ~self._in_b
+        self._only_b = ~self._in_a
+
+        # Columns appearing on both sides get merge-style "_a"/"_b" suffixes.
+        shared = (set(self.df_a.columns) & set(self.df_b.columns)) - set(self.keys)
+        self._suffix_a = {c: f"{c}_a" for c in shared}
+        self._suffix_b = {c: f"{c}_b" for c in shared}
+        self._out_cols = [
+            c if c in self.keys else self._suffix_a.get(c, c)
+            for c in self.df_a.columns
+        ] + [self._suffix_b.get(c, c) for c in self.df_b.columns if c not in self.keys]
+
+    # A ⧵ B  and  B ⧵ A, padded with NaN columns for the missing side.
+    # Matching the old outer merge, a column is promoted (int → float,
+    # bool → object) whenever the other frame has unmatched rows.
+    @cached_property
+    def unmatched_a(self) -> pd.DataFrame:
+        return self._pad_unmatched(
+            self.df_a.loc[self._only_a].rename(columns=self._suffix_a),
+            self.df_b.rename(columns=self._suffix_b),
+            self._out_cols,
+            promote=bool(self._only_b.any()),
         )
 
-        # A ⧵ B  and  B ⧵ A
-        self.unmatched_a = merged.query("_merge == 'left_only'").drop(columns="_merge")
-        self.unmatched_b = merged.query("_merge == 'right_only'").drop(columns="_merge")
+    @cached_property
+    def unmatched_b(self) -> pd.DataFrame:
+        return self._pad_unmatched(
+            self.df_b.loc[self._only_b].rename(columns=self._suffix_b),
+            self.df_a.rename(columns=self._suffix_a),
+            self._out_cols,
+            promote=bool(self._only_a.any()),
+        )
 
-        # Rows present in both → look for cell differences
-        both = merged.query("_merge == 'both'").drop(columns="_merge").copy()
+    @cached_property
+    def mismatches(self) -> pd.DataFrame:
+        # Rows present in both → align on keys and look for cell differences
+        # sort=False skips the lexicographic key sort; under copy-on-write
+        # pandas the merge result already shares blocks where it can, so the
+        # deprecated copy=False knob is not needed.
+        both = self.df_a.loc[self._in_b].merge(
+            self.df_b.loc[self._in_a],
+            on=self.keys,
+            how="inner",
+            suffixes=("_a", "_b"),
+            sort=False,
+        )
 
-        diff_mask = pd.Series(False, index=both.index)
-        for base in (c[:-2] for c in both.columns if c.endswith("_a")):
-            col_a, col_b = f"{base}_a", f"{base}_b"
-            if pd.api.types.is_numeric_dtype(both[col_a]):
-                equal_num = (
-                    (both[col_a] - both[col_b]).abs()
-                    <= self.abs_tol + self.rel_tol * both[col_b].abs()
+        # _partition_keys already knows which columns are shared; suffix
+        # sniffing on the merged frame would trip over one-sided columns
+        # (KeyError on the missing "_b" twin, or a real name ending in "_a").
+        bases = [c for c in self.df_a.columns if c in self._suffix_a]
+        # Classify dtypes in one select_dtypes pass rather than a
+        # pd.api.types.is_numeric_dtype dispatch per column.
+        numeric_columns = set(both.select_dtypes(include="number").columns)
+        numeric_bases = [b for b in bases if f"{b}_a" in numeric_columns]
+        other_bases = [b for b in bases if b not in numeric_bases]
+
+        # One 2-D comparison per column group instead of one Series op (and
+        # one intermediate allocation) per column.
+        diff_mask = np.zeros(len(both), dtype=bool)
+        if numeric_bases:
+            values_a = both[[f"{b}_a" for b in numeric_bases]].to_numpy()
+            values_b = both[[f"{b}_b" for b in numeric_bases]].to_numpy()
+            if _numba_diff_rows is not None and all(
+                v.dtype.kind in "if" for v in (values_a, values_b)
+            ):
+                # Fused kernel: one pass, no temporaries, early exit per row.
+                diff_mask |= _numba_diff_rows(
+                    values_a.astype(np.float64, copy=False),
+                    values_b.astype(np.float64, copy=False),
+                    self.abs_tol,
+                    self.rel_tol,
                 )
-                diff_mask |= ~equal_num
             else:
-                diff_mask |= both[col_a] != both[col_b]
-
-        self.mismatches = both.loc[diff_mask].reset_index(drop=True)
+                # In-place ufuncs: one float work array per operand instead of
+                # a fresh temporary for every step of the expression.
+                diff = np.subtract(values_a, values_b, dtype=np.float64)
+                np.abs(diff, out=diff)
+                thresh = np.abs(values_b, dtype=np.float64)
+                np.multiply(thresh, self.rel_tol, out=thresh)
+                np.add(thresh, self.abs_tol, out=thresh)
+                # less_equal is False for NaN, so ~ keeps NaN cells as diffs.
+                equal_num = np.less_equal(diff, thresh)
+                np.logical_not(equal_num, out=equal_num)
+                diff_mask |= equal_num.any(axis=1)
+        if other_bases:
+            values_a = both[[f"{b}_a" for b in other_bases]].to_numpy()
+            values_b = both[[f"{b}_b" for b in other_bases]].to_numpy()
+            diff_mask |= (values_a != values_b).any(axis=1)
+
+        return both.loc[diff_mask].reset_index(drop=True)
+
+    def _pad_unmatched(
+        self,
+        present: pd.DataFrame,
+        other: pd.DataFrame,
+        out_cols: list[str],
+        *,
+        promote: bool,
+    ) -> pd.DataFrame:
+        """Pad one-sided rows with NaN columns for the side they lack."""
+        padded = present.copy(deep=False)
+        if promote:
+            casts = {
+                column: self._nan_dtype(padded[column].dtype)
+                for column in padded.columns
+                if column not in self.keys
+            }
+            casts = {c: d for c, d in casts.items() if d != padded[c].dtype}
+            if casts:
+                padded = padded.astype(casts)
+        for column in other.columns:
+            if column not in padded.columns:
+                padded[column] = pd.Series(
+                    np.nan, index=padded.index, dtype=self._nan_dtype(other[column].dtype)
+                )
+        return padded[out_cols]
+
+    @staticmethod
+    def _nan_dtype(dtype: Any) -> Any:
+        """Dtype *dtype* is promoted to when it has to hold NaN."""
+        kind = getattr(dtype, "kind", None)
+        if kind in "iu":
+            return np.dtype("float64")
+        if kind == "b":
+            return np.dtype("object")
+        return dtype
 
     # ------------------------ dunder sugar ------------------------------- #
     def __repr__(self) -> str:  # pragma: no cover
@@ -8,18 +8,27 @@ from typing import IO, Any, BinaryIO, TextIO
 import pandas as pd
 from pandas import DataFrame
 
+try:
+    import pyarrow  # noqa: F401
+
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover - optional accelerator
+    _HAS_PYARROW = False
+
 FilePath = str | os.PathLike[str]
 ReadCsvBuffer = TextIO | BinaryIO
 WriteCsvBuffer = TextIO | BinaryIO
 ReadExcelBuffer = IO[bytes]
 WriteExcelBuffer = IO[bytes]
+ReadParquetBuffer = IO[bytes]
+WriteParquetBuffer = IO[bytes]
 
 
 def read_csv(
     path_or_buffer: FilePath | ReadCsvBuffer,
     /,
     **kwargs: Any,
-) -> DataFrame:
+) -> DataFrame | pd.api.typing.TextFileReader:
     """Return a DataFrame by delegating to :func:`pandas.read_csv`.
 
     Parameters
@@ -29,9 +38,31 @@ def read_csv(
         data from.
     **kwargs:
         Additional keyword arguments passed directly to
-        :func:`pandas.read_csv` (e.g. ``dtype`` or ``parse_dates``).
+        :func:`pandas.read_csv` (e.g. ``dtype`` or ``parse_dates``). Pass
+        ``chunksize`` to stream files larger than memory: the call then
+        returns an iterator of DataFrame chunks instead of a single frame.
+
+    Notes
+    -----
+    When pyarrow is installed, file paths are parsed with the multithreaded
+    ``engine="pyarrow"`` unless the caller picks an engine (or an option the
+    pyarrow engine does not support, in which case pandas' default parser
+    handles the file).
     """
 
+    if (
+        _HAS_PYARROW
+        and isinstance(path_or_buffer, (str, os.PathLike))
+        and "engine" not in kwargs
+        and "chunksize" not in kwargs
+        and "iterator" not in kwargs
+    ):
+        try:
+            return pd.read_csv(path_or_buffer, engine="pyarrow", **kwargs)
+        except ValueError:
+            # An option the pyarrow engine cannot handle; retry below.
+            pass
+
     return pd.read_csv(path_or_buffer, **kwargs)
 
 
@@ -41,6 +72,7 @@ def write_csv(
     /,
     *,
     index: bool | None = None,
+    chunksize: int | None = None,
     **kwargs: Any,
 ) -> None:
     """Write a DataFrame to CSV using :meth:`pandas.DataFrame.to_csv`.
@@ -55,6 +87,9 @@ def write_csv(
     index:
         Whether to include the DataFrame index in the output. ``None`` keeps
         pandas' default behaviour (``True``).
+    chunksize:
+        When set, rows are appended in batches of this size so peak memory
+        during formatting stays bounded by one batch.
     **kwargs:
         Additional keyword arguments forwarded to
         :meth:`pandas.DataFrame.to_csv` (e.g. ``sep`` or ``encoding``).
@@ -63,6 +98,23 @@ def write_csv(
     to_csv_kwargs: dict[str, Any] = {}
     if index is not None:
         to_csv_kwargs["index"] = index
+
+    if chunksize is not None and len(dataframe) > chunksize:
+        # The chunked path owns mode/header, so pop any caller-supplied
+        # values rather than forwarding duplicates: header applies to the
+        # first chunk only, and later chunks must append regardless.
+        header = kwargs.pop("header", True)
+        first_mode = kwargs.pop("mode", "w")
+        for start in range(0, len(dataframe), chunksize):
+            dataframe.iloc[start : start + chunksize].to_csv(
+                path_or_buffer,
+                mode=first_mode if start == 0 else "a",
+                header=header if start == 0 else False,
+                **to_csv_kwargs,
+                **kwargs,
+            )
+        return
+
     dataframe.to_csv(path_or_buffer, **to_csv_kwargs, **kwargs)
 
 
@@ -112,6 +164,12 @@ def write_excel(
     **kwargs:
         Additional keyword arguments forwarded to
         :meth:`pandas.DataFrame.to_excel` (e.g. ``engine``).
+
+    Notes
+    -----
+    When writing to a file path without an explicit ``engine``, xlsxwriter's
+    ``constant_memory`` mode is used if xlsxwriter is installed, streaming
+    rows to disk instead of building the whole workbook in memory.
     """
 
     to_excel_kwargs: dict[str, Any] = {}
@@ -120,4 +178,68 @@ def write_excel(
     if index is not None:
         to_excel_kwargs["index"] = index
 
+    if "engine" not in kwargs and isinstance(path_or_buffer, (str, os.PathLike)):
+        try:
+            writer = pd.ExcelWriter(
+                path_or_buffer,
+                engine="xlsxwriter",
+                engine_kwargs={"options": {"constant_memory": True}},
+            )
+        except ImportError:
+            pass  # xlsxwriter not installed; let pandas pick its engine.
+        else:
+            with writer:
+                dataframe.to_excel(writer, **to_excel_kwargs, **kwargs)
+            return
+
     dataframe.to_excel(path_or_buffer, **to_excel_kwargs, **kwargs)
+
+
+def read_parquet(
+    path_or_buffer: FilePath | ReadParquetBuffer,
+    /,
+    **kwargs: Any,
+) -> DataFrame:
+    """Return a DataFrame by delegating to :func:`pandas.read_parquet`.
+
+    Parameters
+    ----------
+    path_or_buffer:
+        A file path string, pathlib.Path, or file-like object containing
+        Parquet data.
+    **kwargs:
+        Additional keyword arguments passed directly to
+        :func:`pandas.read_parquet` (e.g. ``columns`` or ``engine``).
+    """
+
+    return pd.read_parquet(path_or_buffer, **kwargs)
+
+
+def write_parquet(
+    dataframe: DataFrame,
+    path_or_buffer: FilePath | WriteParquetBuffer,
+    /,
+    *,
+    index: bool | None = None,
+    **kwargs: Any,
+) -> None:
+    """Write a DataFrame to Parquet via :meth:`pandas.DataFrame.to_parquet`.
+
+    Parameters
+    ----------
+    dataframe:
+        The DataFrame to be written to disk or a buffer.
+    path_or_buffer:
+        Destination path or binary buffer.
+    index:
+        Whether to include the DataFrame index in the output. ``None`` keeps
+        pandas' default behaviour.
+    **kwargs:
+        Additional keyword arguments forwarded to
+        :meth:`pandas.DataFrame.to_parquet` (e.g. ``compression``).
+    """
+
+    to_parquet_kwargs: dict[str, Any] = {}
+    if index is not None:
+        to_parquet_kwargs["index"] = index
+    dataframe.to_parquet(path_or_buffer, **to_parquet_kwargs, **kwargs)
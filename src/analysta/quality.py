@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import re
+from collections.abc import Callable, Mapping, Sequence
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -17,8 +19,6 @@ from pandas.api.types import (
     pandas_dtype,
 )
 
-Issue = dict[str, str]
-
 _MISSING_VALUE_TOKENS = {
     "",
     "-",
@@ -73,88 +73,179 @@ def audit_dataframe(
         A DataFrame with columns ``column``, ``issue`` and ``details``.
     """
 
-    issues: list[Issue] = []
-    allow_nulls = allow_nulls or {}
-    expected_dtypes = expected_dtypes or {}
-    date_formats = date_formats or {}
-    distribution_expectations = distribution_expectations or {}
-
-    normalised_df = _normalise_dataframe(df)
-
-    for column, allow in allow_nulls.items():
-        if allow:
-            continue
-        if column not in df.columns:
-            continue
-        series = normalised_df[column]
-        null_mask = series.isna()
-        if null_mask.any():
-            indices = list(series.index[null_mask])
-            issues.append(
-                {
-                    "column": column,
-                    "issue": "null_forbidden",
-                    "details": _summarise_values("null", indices),
-                }
-            )
-
-    for column, expected in expected_dtypes.items():
-        if column not in df.columns:
-            continue
-        series = normalised_df[column]
-        non_null_series = series[~series.isna()]
-        if non_null_series.empty:
-            continue
-        mismatch_mask = _type_mismatch_mask(non_null_series, expected)
-        if mismatch_mask is None:
-            continue
-        if mismatch_mask.any():
-            invalid = non_null_series[mismatch_mask]
-            issues.append(
-                {
-                    "column": column,
-                    "issue": "dtype_mismatch",
-                    "details": _summarise_invalid_values(expected, invalid),
-                }
-            )
-
-    for column, formats in date_formats.items():
-        if column not in df.columns:
-            continue
-        series = normalised_df[column]
-        non_null_series = series[~series.isna()]
-        if non_null_series.empty:
-            continue
-        if is_datetime64_any_dtype(non_null_series):
-            continue
-        invalid_mask = _date_invalid_mask(non_null_series, formats)
-        if invalid_mask.any():
-            invalid = non_null_series[invalid_mask]
-            issues.append(
-                {
-                    "column": column,
-                    "issue": "invalid_date_format",
-                    "details": _summarise_values(invalid, list(invalid.index)),
-                }
-            )
-
-    for column, expectation in distribution_expectations.items():
-        if column not in df.columns:
-            continue
-        series = df[column]
-        outlier_issues = _detect_outliers(column, series, expectation)
-        issues.extend(outlier_issues)
-
-    if issues:
-        result = pd.DataFrame(issues, columns=["column", "issue", "details"])
-        return result.sort_values(["column", "issue"], ignore_index=True)
-    return pd.DataFrame(columns=["column", "issue", "details"])
+    checker = compile_audit(
+        allow_nulls=allow_nulls,
+        expected_dtypes=expected_dtypes,
+        date_formats=date_formats,
+        distribution_expectations=distribution_expectations,
+    )
+    return checker(df)
+
+
+def compile_audit(
+    *,
+    allow_nulls: Mapping[str, bool] | None = None,
+    expected_dtypes: Mapping[str, Any] | None = None,
+    date_formats: Mapping[str, str | Sequence[str]] | None = None,
+    distribution_expectations: Mapping[str, Mapping[str, Any]] | None = None,
+) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """Pre-compile an audit schema into a reusable checker.
+
+    The schema-dependent work — filtering the null policy, classifying the
+    expected dtypes and coercing date formats to lists — runs once here, so
+    pipelines that audit frame after frame against the same schema only pay
+    for the per-frame scans. Accepts the same keyword arguments as
+    :func:`audit_dataframe` and returns a callable with its signature's
+    single-frame half: ``checker(df) -> issues DataFrame``.
+    """
+
+    null_forbidden = frozenset(
+        column for column, allow in (allow_nulls or {}).items() if not allow
+    )
+    dtype_checks = {
+        column: (expected, _normalise_dtype(expected))
+        for column, expected in (expected_dtypes or {}).items()
+    }
+    format_lists = {
+        column: _normalise_formats(formats)
+        for column, formats in (date_formats or {}).items()
+    }
+    distribution_checks = dict(distribution_expectations or {})
+
+    # Columns are visited in sorted order and their checks in issue-name
+    # order, so the issues list comes out pre-sorted and the result needs
+    # no final sort_values.
+    audit_columns = sorted(
+        null_forbidden | set(dtype_checks) | set(format_lists) | set(distribution_checks)
+    )
+
+    def _audit(df: pd.DataFrame) -> pd.DataFrame:
+        # Column-wise accumulators: the result frame is built straight from
+        # three homogeneous lists, skipping per-row dict allocation and the
+        # constructor's row-inference path.
+        issue_columns: list[str] = []
+        issue_types: list[str] = []
+        issue_details: list[str] = []
+
+        def _record(column: str, issue: str, details: str) -> None:
+            issue_columns.append(column)
+            issue_types.append(issue)
+            issue_details.append(details)
+
+        normalised_df = _normalise_dataframe(df)
+
+        # Each column is scanned for nulls at most once, no matter how many
+        # of the check phases mention it.
+        columns = set(df.columns)
+        null_masks: dict[str, pd.Series] = {}
+        non_null_cache: dict[str, pd.Series] = {}
+
+        def _null_mask(column: str) -> pd.Series:
+            if column not in null_masks:
+                null_masks[column] = normalised_df[column].isna()
+            return null_masks[column]
+
+        def _non_null(column: str) -> pd.Series:
+            if column not in non_null_cache:
+                series = normalised_df[column]
+                non_null_cache[column] = series[~_null_mask(column)]
+            return non_null_cache[column]
+
+        # Columns listed under date_formats are parsed at most once, even
+        # when a datetime expected_dtype would otherwise trigger a second
+        # to_datetime.
+        date_invalid_masks: dict[str, pd.Series] = {}
+
+        def _date_invalid(column: str) -> pd.Series:
+            if column not in date_invalid_masks:
+                formats = format_lists[column]
+                date_invalid_masks[column] = _deduplicated_mask(
+                    _non_null(column),
+                    lambda values: _date_invalid_mask(values, formats),
+                )
+            return date_invalid_masks[column]
+
+        for column in audit_columns:
+            if column not in columns:
+                continue
+
+            if column in dtype_checks:
+                expected, category = dtype_checks[column]
+                non_null_series = _non_null(column)
+                mismatch_mask = None
+                if not non_null_series.empty:
+                    if (
+                        column in format_lists
+                        and category == "datetime"
+                        and not is_datetime64_any_dtype(non_null_series)
+                    ):
+                        # The date-format check parses this column anyway;
+                        # reuse its mask instead of running a second,
+                        # formatless to_datetime.
+                        mismatch_mask = _date_invalid(column)
+                    else:
+                        mismatch_mask = _deduplicated_mask(
+                            non_null_series,
+                            lambda values: _type_mismatch_mask(values, category),
+                        )
+                if mismatch_mask is not None and mismatch_mask.any():
+                    invalid = non_null_series[mismatch_mask]
+                    _record(
+                        column,
+                        "dtype_mismatch",
+                        _summarise_invalid_values(expected, invalid),
+                    )
+
+            if column in format_lists:
+                non_null_series = _non_null(column)
+                if not (
+                    non_null_series.empty
+                    or is_datetime64_any_dtype(non_null_series)
+                ):
+                    invalid_mask = _date_invalid(column)
+                    if invalid_mask.any():
+                        invalid = non_null_series[invalid_mask]
+                        _record(
+                            column,
+                            "invalid_date_format",
+                            _summarise_series(invalid, invalid.index),
+                        )
+
+            if column in null_forbidden:
+                null_mask = _null_mask(column)
+                if null_mask.any():
+                    _record(
+                        column,
+                        "null_forbidden",
+                        _summarise_scalar("null", null_mask.index[null_mask]),
+                    )
+
+            if column in distribution_checks:
+                for details in _detect_outliers(df[column], distribution_checks[column]):
+                    _record(column, "outlier", details)
+
+        if not issue_columns:
+            return pd.DataFrame(columns=["column", "issue", "details"])
+        return pd.DataFrame(
+            {
+                "column": issue_columns,
+                "issue": issue_types,
+                "details": issue_details,
+            }
+        )
+
+    return _audit
 
 
 def _normalise_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    normalised = df.copy()
+    # Shallow copy: only text columns are actually rewritten, so numeric and
+    # datetime blocks are shared with the caller's frame instead of copied.
+    normalised = df.copy(deep=False)
     for column in normalised.columns:
-        normalised[column] = _normalise_series(normalised[column])
+        series = normalised[column]
+        replacement = _normalise_series(series)
+        if replacement is not series:
+            normalised[column] = replacement
     return normalised
 
 
@@ -162,48 +253,130 @@ def _normalise_series(series: pd.Series) -> pd.Series:
     if not (is_string_dtype(series.dtype) or series.dtype == "object"):
         return series
 
-    def _convert(value: Any) -> Any:
-        if isinstance(value, bytes):
-            try:
-                value = value.decode()
-            except Exception:  # pragma: no cover - very unlikely
-                return value
-        if isinstance(value, str):
-            trimmed = value.strip()
-            lowered = trimmed.lower()
-            if lowered in _MISSING_VALUE_TOKENS:
-                return np.nan
-            return trimmed
-        return value
-
-    return series.map(_convert)
-
-
-def _type_mismatch_mask(series: pd.Series, expected: Any) -> pd.Series | None:
-    category = _normalise_dtype(expected)
+    if series.dtype != object:
+        # String-dtype columns hold nothing but strings, so the whole
+        # normalisation vectorizes: strip, then blank out missing tokens.
+        trimmed = series.str.strip()
+        missing = trimmed.str.lower().isin(_MISSING_VALUE_TOKENS)
+        return trimmed.mask(missing)
+
+    # Object columns can mix types; categorise each value once in a plain
+    # loop over the raw array instead of Series.map dispatch.
+    values = [_convert_value(value) for value in series.to_numpy()]
+    return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+
+def _convert_value(value: Any) -> Any:
+    if isinstance(value, bytes):
+        try:
+            value = value.decode()
+        except Exception:  # pragma: no cover - very unlikely
+            return value
+    if isinstance(value, str):
+        trimmed = value.strip()
+        if trimmed.lower() in _MISSING_VALUE_TOKENS:
+            return np.nan
+        return trimmed
+    return value
+
+
+def _deduplicated_mask(
+    series: pd.Series,
+    mask_fn: Callable[[pd.Series], pd.Series | None],
+) -> pd.Series | None:
+    """Evaluate *mask_fn* on unique values when the column repeats heavily.
+
+    Object columns in audit data often hold a handful of distinct strings;
+    factorizing first runs the per-value check on K uniques instead of N
+    rows, followed by a single O(N) code lookup to broadcast the verdicts.
+    """
+
+    if series.dtype == object:
+        try:
+            codes, uniques = series.factorize()
+        except TypeError:
+            # Unhashable values (lists, dicts, ...) cannot be factorized;
+            # the per-row path below handles them like any other object.
+            return mask_fn(series)
+        if len(uniques) * 4 < len(series):
+            unique_mask = mask_fn(pd.Series(uniques))
+            if unique_mask is None:
+                return None
+            return pd.Series(unique_mask.to_numpy()[codes], index=series.index)
+    return mask_fn(series)
+
+
+def _type_mismatch_mask(series: pd.Series, category: str) -> pd.Series | None:
+    # Callers hand over the cached null-free slice of each column and the
+    # pre-classified dtype category, so the branches below never re-derive a
+    # notna mask: anything that coerces to NaN did so because the original
+    # value could not be parsed.
     if category == "integer":
+        if is_integer_dtype(series):
+            # Native integer columns cannot hold mismatches.
+            return pd.Series(False, index=series.index)
         converted = pd.to_numeric(series, errors="coerce")
-        fractional = converted % 1
-        fractional_mask = pd.Series(
-            ~np.isclose(fractional.fillna(0), 0), index=converted.index
-        )
-        fractional_mask &= converted.notna()
-        invalid = series.notna() & (converted.isna() | fractional_mask)
-        return invalid
+        values = converted.to_numpy()
+        if values.dtype.kind in "iu":
+            # Already integral — only unparseable originals can be invalid,
+            # and those would have forced a float result.
+            invalid_values = np.zeros(len(values), dtype=bool)
+        else:
+            # One fused pass: unparseable (NaN) or carrying a fraction. The
+            # exact trunc round-trip replaces the old modulo + isclose epsilon.
+            invalid_values = np.isnan(values) | (values != np.trunc(values))
+        return pd.Series(invalid_values, index=series.index)
     if category == "float":
+        if is_numeric_dtype(series):
+            # Already numeric; nothing can fail to coerce.
+            return pd.Series(False, index=series.index)
         converted = pd.to_numeric(series, errors="coerce")
-        invalid = series.notna() & converted.isna()
-        return invalid
+        values = converted.to_numpy()
+        if values.dtype.kind in "iu":
+            # Integer result means every value parsed.
+            invalid_values = np.zeros(len(values), dtype=bool)
+        else:
+            invalid_values = np.isnan(values)
+        return pd.Series(invalid_values, index=series.index)
     if category == "string":
-        invalid = series.notna() & ~series.map(lambda value: isinstance(value, str))
-        return invalid
+        if series.dtype != object and is_string_dtype(series.dtype):
+            # String-dtype columns cannot hold non-strings.
+            return pd.Series(False, index=series.index)
+        is_str = np.fromiter(
+            (type(value) is str for value in series.to_numpy()),
+            dtype=bool,
+            count=len(series),
+        )
+        np.logical_not(is_str, out=is_str)
+        return pd.Series(is_str, index=series.index)
     if category == "datetime":
-        parsed = pd.to_datetime(series, errors="coerce")
-        invalid = series.notna() & parsed.isna()
-        return invalid
+        if is_datetime64_any_dtype(series):
+            return pd.Series(False, index=series.index)
+        parsed = pd.to_datetime(series, errors="coerce", cache=True)
+        return parsed.isna()
     return None
 
 
+# Informal dtype names that pandas_dtype cannot resolve; anything it can
+# resolve (e.g. "int64", "float32", "datetime64[ns]") never reaches this
+# table, so one hash lookup replaces the old substring scans.
+_DTYPE_ALIASES = {
+    "int": "integer",
+    "integer": "integer",
+    "float": "float",
+    "double": "float",
+    "numeric": "float",
+    "number": "float",
+    "date": "datetime",
+    "datetime": "datetime",
+    "timestamp": "datetime",
+    "str": "string",
+    "string": "string",
+    "text": "string",
+    "object": "string",
+}
+
+
 def _normalise_dtype(expected: Any) -> str:
     try:
         dtype = pandas_dtype(expected)
@@ -229,58 +402,135 @@ def _normalise_dtype(expected: Any) -> str:
             return "string"
 
     if isinstance(expected, str):
-        lower = expected.lower()
-        if "int" in lower:
-            return "integer"
-        if any(token in lower for token in ("float", "double", "numeric", "number")):
-            return "float"
-        if "datetime" in lower or lower.startswith("date"):
-            return "datetime"
-        if lower in {"str", "string", "object"}:
-            return "string"
+        return _DTYPE_ALIASES.get(expected.strip().lower(), "unknown")
 
     return "unknown"
 
 
-def _date_invalid_mask(series: pd.Series, formats: str | Sequence[str]) -> pd.Series:
-    if isinstance(formats, str):
-        formats_to_try: list[str] = [formats]
-    elif isinstance(formats, Sequence) and not isinstance(formats, (bytes, bytearray)):
-        formats_to_try = [str(fmt) for fmt in formats]
-    else:
-        formats_to_try = [str(formats)]
+# Deliberately generous shapes (strptime accepts e.g. single-digit days),
+# so a value failing the probe is guaranteed to fail the real parse.
+_STRFTIME_TOKEN_PATTERNS = {
+    "%Y": r"\d{1,4}",
+    "%y": r"\d{1,2}",
+    "%m": r"\d{1,2}",
+    "%d": r"\d{1,2}",
+    "%H": r"\d{1,2}",
+    "%I": r"\d{1,2}",
+    "%M": r"\d{1,2}",
+    "%S": r"\d{1,2}",
+    "%j": r"\d{1,3}",
+    "%f": r"\d{1,6}",
+    "%a": r"[^\W\d_]+",
+    "%A": r"[^\W\d_]+",
+    "%b": r"[^\W\d_]+",
+    "%B": r"[^\W\d_]+",
+    "%p": r"[^\W\d_]+",
+    "%%": "%",
+}
+
+
+@lru_cache(maxsize=None)
+def _format_probe(fmt: str) -> re.Pattern[str] | None:
+    """Compile a cheap shape check for *fmt*, or ``None`` if it has
+    directives the table above cannot model."""
+
+    parts: list[str] = []
+    i = 0
+    while i < len(fmt):
+        if fmt[i] == "%":
+            pattern = _STRFTIME_TOKEN_PATTERNS.get(fmt[i : i + 2])
+            if pattern is None:
+                return None
+            parts.append(pattern)
+            i += 2
+        else:
+            parts.append(re.escape(fmt[i]))
+            i += 1
+    return re.compile("".join(parts))
 
-    valid_mask = pd.Series(False, index=series.index)
+
+def _normalise_formats(formats: str | Sequence[str]) -> list[str]:
+    if isinstance(formats, str):
+        return [formats]
+    if isinstance(formats, Sequence) and not isinstance(formats, (bytes, bytearray)):
+        return [str(fmt) for fmt in formats]
+    return [str(formats)]
+
+
+def _date_invalid_mask(series: pd.Series, formats_to_try: Sequence[str]) -> pd.Series:
+    # Each format only sees the rows every previous format failed to parse,
+    # so k formats cost one full parse plus progressively smaller retries.
+    # On string columns a regex shape probe weeds out obviously malformed
+    # values first, keeping them away from strptime entirely. Bookkeeping is
+    # positional (iloc) rather than label-based: index labels may repeat, and
+    # .loc on a repeated label would both over-select and mis-flag rows.
+    probe_eligible = series.dtype != object and is_string_dtype(series.dtype)
+    invalid_positions = np.arange(len(series))
     for fmt in formats_to_try:
-        parsed = pd.to_datetime(series, format=fmt, errors="coerce")
-        valid_mask |= parsed.notna()
-    return ~valid_mask
+        if invalid_positions.size == 0:
+            break
+        candidates = series.iloc[invalid_positions]
+        failed_shape = None
+        if probe_eligible:
+            probe = _format_probe(fmt)
+            if probe is not None:
+                shaped = candidates.str.fullmatch(probe, na=False).to_numpy()
+                failed_shape = invalid_positions[~shaped]
+                candidates = candidates[shaped]
+                invalid_positions = invalid_positions[shaped]
+                if candidates.empty:
+                    invalid_positions = failed_shape
+                    continue
+        parsed = pd.to_datetime(candidates, format=fmt, errors="coerce", cache=True)
+        invalid_positions = invalid_positions[parsed.isna().to_numpy()]
+        if failed_shape is not None and failed_shape.size:
+            invalid_positions = np.concatenate([invalid_positions, failed_shape])
+
+    # One positional scatter into a fresh all-False mask.
+    mask = np.zeros(len(series), dtype=bool)
+    mask[invalid_positions] = True
+    return pd.Series(mask, index=series.index)
+
+
+_MAX_REPORTED_ROWS = 100
+
+
+def _format_indices(indices: Any) -> str:
+    """Render failing-row labels, capped so huge issues stay cheap to report."""
+
+    total = len(indices)
+    head = indices[:_MAX_REPORTED_ROWS]
+    head = head.tolist() if hasattr(head, "tolist") else list(head)
+    if total > _MAX_REPORTED_ROWS:
+        return f"{head} (+{total - _MAX_REPORTED_ROWS} more)"
+    return str(head)
 
 
-def _summarise_values(values: Any, indices: list[Any]) -> str:
-    if isinstance(values, pd.Series):
-        sample = values.astype(str).head(5).tolist()
-    elif hasattr(values, "__iter__") and not isinstance(values, (str, bytes)):
-        sample = list(map(str, list(values)[:5]))
-    else:
-        sample = [str(values)]
-    return f"Rows {indices}; samples: {sample}"
+# Callers know what they hold, so the summaries are split by type instead
+# of sniffing with isinstance; the Series path slices before stringifying
+# so only the five sampled values are ever converted.
+def _summarise_series(values: pd.Series, indices: Any) -> str:
+    sample = values.head(5).astype(str).tolist()
+    return f"Rows {_format_indices(indices)}; samples: {sample}"
+
+
+def _summarise_scalar(value: Any, indices: Any) -> str:
+    return f"Rows {_format_indices(indices)}; samples: {[str(value)]}"
 
 
 def _summarise_invalid_values(expected: Any, invalid: pd.Series) -> str:
-    sample_values = invalid.astype(str).head(5).tolist()
-    indices = list(invalid.index)
-    return f"Expected {expected!r}; rows {indices}; samples: {sample_values}"
+    sample_values = invalid.head(5).astype(str).tolist()
+    return f"Expected {expected!r}; rows {_format_indices(invalid.index)}; samples: {sample_values}"
 
 
 def _summarise_outliers(
     values: pd.Series,
-    indices: list[Any],
+    indices: Any,
     *,
     bounds: tuple[Any, Any] | None = None,
     delta: Any | None = None,
 ) -> str:
-    summary = _summarise_values(values, indices)
+    summary = _summarise_series(values, indices)
     extras: list[str] = []
     if bounds is not None:
         extras.append(f"bounds={bounds}")
@@ -292,8 +542,8 @@ def _summarise_outliers(
 
 
 def _detect_outliers(
-    column: str, series: pd.Series, expectation: Mapping[str, Any]
-) -> list[Issue]:
+    series: pd.Series, expectation: Mapping[str, Any]
+) -> list[str]:
     non_null = series[~series.isna()]
     if non_null.empty:
         return []
@@ -302,28 +552,31 @@ def _detect_outliers(
     if converted is None or kind is None:
         return []
 
-    issues: list[Issue] = []
+    # Drop NaNs exactly once; both checks below share the raw array and
+    # its index instead of re-filtering per check.
+    valid = converted.dropna()
+    if valid.empty:
+        return []
+    values = valid.to_numpy()
+    index = valid.index
+
+    details: list[str] = []
 
     quantiles = expectation.get("quantiles")
     if quantiles is not None:
-        bounds = _quantile_bounds(converted, quantiles)
+        bounds = _quantile_bounds(valid, quantiles)
         if bounds is not None:
             lower, upper = bounds
-            valid = converted.dropna()
-            mask = valid.lt(lower) | valid.gt(upper)
-            outlier_indices = list(valid.index[mask])
-            if outlier_indices:
-                values = non_null.loc[outlier_indices]
-                issues.append(
-                    {
-                        "column": column,
-                        "issue": "outlier",
-                        "details": _summarise_outliers(
-                            values,
-                            outlier_indices,
-                            bounds=(lower, upper),
-                        ),
-                    }
+            mask = (values < lower) | (values > upper)
+            if mask.any():
+                outlier_indices = list(index[mask])
+                outlier_values = non_null.loc[outlier_indices]
+                details.append(
+                    _summarise_outliers(
+                        outlier_values,
+                        outlier_indices,
+                        bounds=(lower, upper),
+                    )
                 )
 
     delta_config = expectation.get("delta") or expectation.get("rolling_delta")
@@ -332,27 +585,23 @@ def _detect_outliers(
         if delta_threshold is None:
             delta_threshold = delta_config.get("threshold")
         periods = int(delta_config.get("periods", 1))
-        deltas = _rolling_deltas(converted, periods)
-        if deltas is not None and delta_threshold is not None:
+        if delta_threshold is not None and 0 < periods < len(values):
             delta_limit = _normalise_delta_threshold(delta_threshold, kind)
             if delta_limit is not None:
+                deltas = np.abs(values[periods:] - values[:-periods])
                 mask = deltas > delta_limit
-                outlier_indices = list(deltas.index[mask])
-                if outlier_indices:
-                    values = non_null.loc[outlier_indices]
-                    issues.append(
-                        {
-                            "column": column,
-                            "issue": "outlier",
-                            "details": _summarise_outliers(
-                                values,
-                                outlier_indices,
-                                delta=delta_limit,
-                            ),
-                        }
+                if mask.any():
+                    outlier_indices = list(index[periods:][mask])
+                    outlier_values = non_null.loc[outlier_indices]
+                    details.append(
+                        _summarise_outliers(
+                            outlier_values,
+                            outlier_indices,
+                            delta=delta_limit,
+                        )
                     )
 
-    return issues
+    return details
 
 
 def _coerce_numeric_or_datetime(
@@ -384,12 +633,9 @@ def _quantile_bounds(
     except (TypeError, ValueError):
         return None
 
-    valid = series.dropna()
-    if valid.empty:
-        return None
-
+    # Callers pass an already NaN-free series, so no dropna here.
     try:
-        bounds = valid.quantile([lower_q, upper_q])
+        bounds = series.quantile([lower_q, upper_q])
     except (TypeError, ValueError):
         return None
 
@@ -399,17 +645,6 @@ def _quantile_bounds(
     return bounds.iloc[0], bounds.iloc[1]
 
 
-def _rolling_deltas(series: pd.Series, periods: int) -> pd.Series | None:
-    valid = series.dropna()
-    if valid.empty:
-        return None
-    deltas = valid.diff(periods).abs()
-    deltas = deltas.dropna()
-    if deltas.empty:
-        return None
-    return deltas
-
-
 def _normalise_delta_threshold(threshold: Any, kind: str) -> Any | None:
     if kind == "datetime":
         try:
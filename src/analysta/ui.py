@@ -93,14 +93,47 @@ if 'filename_b' not in st.session_state:
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
+@st.cache_data(show_spinner=False, max_entries=4)
+def _parse_upload(name: str, payload: bytes) -> pd.DataFrame:
+    # Streamlit reruns the whole script on every widget interaction; caching
+    # on the raw bytes means each upload is parsed exactly once. The faster
+    # optional engines are tried first and fall back to pandas' defaults.
+    buffer = io.BytesIO(payload)
+    if name.endswith('.csv'):
+        try:
+            return pd.read_csv(buffer, engine="pyarrow")
+        except (ImportError, ValueError):
+            buffer.seek(0)
+            return pd.read_csv(buffer)
+    try:
+        return pd.read_excel(buffer, engine="calamine")
+    except (ImportError, ValueError):
+        buffer.seek(0)
+        return pd.read_excel(buffer)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_audit(df: pd.DataFrame) -> pd.DataFrame:
+    return audit_dataframe(df)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_duplicates(df: pd.DataFrame, columns: tuple) -> pd.DataFrame:
+    return duplicates(df, column=list(columns), counts=True)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_delta(df_a: pd.DataFrame, df_b: pd.DataFrame, keys: tuple,
+                  abs_tol: float, rel_tol: float):
+    delta = Delta(df_a, df_b, keys=list(keys), abs_tol=abs_tol, rel_tol=rel_tol)
+    return delta.unmatched_a, delta.unmatched_b, delta.mismatches, delta.to_html()
+
+
 def load_file(uploaded_file):
     if uploaded_file is None:
         return None
     try:
-        if uploaded_file.name.endswith('.csv'):
-            return pd.read_csv(uploaded_file)
-        else:
-            return pd.read_excel(uploaded_file)
+        return _parse_upload(uploaded_file.name, uploaded_file.getvalue())
     except Exception as e:
         st.error(f"Error loading file: {e}")
         return None
@@ -177,7 +210,9 @@ def render_compare():
     with st.expander("⚙️ Comparison Settings", expanded=True):
         col1, col2, col3 = st.columns([2, 1, 1])
         with col1:
-            common_cols = list(set(df_a.columns) & set(df_b.columns))
+            # Index.intersection keeps A's column order, so the default key
+            # choice is stable across reruns.
+            common_cols = df_a.columns.intersection(df_b.columns, sort=False).tolist()
             keys = st.multiselect("Primary Key(s)", common_cols, default=common_cols[:1] if common_cols else [])
         with col2:
             abs_tol = st.number_input("Abs. Tolerance", value=0.0, step=0.01)
@@ -190,28 +225,29 @@ def render_compare():
 
     if st.button("🚀 Run Comparison", type="primary", use_container_width=True):
         with st.spinner("Crunching numbers..."):
-            delta = Delta(df_a, df_b, keys=keys, abs_tol=abs_tol, rel_tol=rel_tol)
-            
+            unmatched_a, unmatched_b, mismatches, html = _cached_delta(
+                df_a, df_b, tuple(keys), abs_tol, rel_tol
+            )
+
             # Metrics
             st.markdown("### Results Overview")
             m1, m2, m3 = st.columns(3)
-            m1.metric("Rows Only in A", len(delta.unmatched_a), delta_color="off")
-            m2.metric("Rows Only in B", len(delta.unmatched_b), delta_color="off")
-            m3.metric("Mismatches", len(delta.mismatches), delta_color="inverse")
-            
+            m1.metric("Rows Only in A", len(unmatched_a), delta_color="off")
+            m2.metric("Rows Only in B", len(unmatched_b), delta_color="off")
+            m3.metric("Mismatches", len(mismatches), delta_color="inverse")
+
             st.divider()
-            
+
             # Tabs
             t1, t2, t3, t4 = st.tabs(["🔴 Only in A", "🟢 Only in B", "🟡 Mismatches", "📄 Report"])
-            
+
             with t1:
-                st.dataframe(delta.unmatched_a, use_container_width=True)
+                st.dataframe(unmatched_a, use_container_width=True)
             with t2:
-                st.dataframe(delta.unmatched_b, use_container_width=True)
+                st.dataframe(unmatched_b, use_container_width=True)
             with t3:
-                st.dataframe(delta.mismatches, use_container_width=True)
+                st.dataframe(mismatches, use_container_width=True)
             with t4:
-                html = delta.to_html()
                 st.download_button("📥 Download HTML Report", html, "report.html", "text/html")
                 st.components.v1.html(html, height=600, scrolling=True)
 
@@ -227,7 +263,7 @@ def render_audit():
     st.markdown(f"**Auditing:** `{st.session_state.filename_a}`")
     
     if st.button("Run Audit"):
-        issues = audit_dataframe(target_df)
+        issues = _cached_audit(target_df)
         
         if issues.empty:
             st.success("✨ No obvious quality issues found!")
@@ -253,7 +289,8 @@ def render_duplicates():
     cols = st.multiselect("Check for duplicates based on:", target_df.columns, default=list(target_df.columns))
     
     if cols:
-        dups = duplicates(target_df, column=cols, counts=True)
+        with st.spinner("Scanning for duplicates..."):
+            dups = _cached_duplicates(target_df, tuple(cols))
         count = len(dups)
         
         if count > 0:
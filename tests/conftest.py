@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+# Make the src layout importable once per session instead of repeating the
+# path insert at the top of every test module.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+@pytest.fixture(scope="session")
+def scratch_dir(tmp_path_factory):
+    """One scratch directory for the whole run.
+
+    Tests keep isolation by choosing unique filenames inside it, which is
+    cheaper than the per-test mkdir that function-scoped tmp_path does.
+    """
+    return tmp_path_factory.mktemp("analysta")
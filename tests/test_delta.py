@@ -1,9 +1,5 @@
-import os
-import sys
-
 import pandas as pd
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 from analysta import Delta
 
 
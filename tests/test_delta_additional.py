@@ -1,9 +1,6 @@
-import os
-import sys
 import pandas as pd
 import numpy as np
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 from analysta import Delta
 
 
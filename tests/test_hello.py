@@ -1,9 +1,5 @@
-import os
-import sys
 from analysta import hello
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 
 def test_hello_prints_greeting(capsys):
     hello()
@@ -0,0 +1,23 @@
+from uuid import uuid4
+
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+# Module-scoped so the skip happens at collection and the CSV/parquet tests
+# in test_io.py keep running when openpyxl is missing.
+pytest.importorskip("openpyxl")
+
+from analysta.io import read_excel, write_excel
+
+
+@pytest.mark.slow
+def test_excel_round_trip(scratch_dir):
+    dataframe = pd.DataFrame({"id": [1, 2], "label": ["a", "b"]})
+    excel_path = scratch_dir / f"sample_{uuid4().hex}.xlsx"
+
+    write_excel(dataframe, excel_path, sheet_name="Data", index=False)
+
+    result = read_excel(excel_path, sheet_name="Data")
+
+    pdt.assert_frame_equal(result, dataframe)
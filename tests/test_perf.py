@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from analysta import audit_dataframe, find_duplicates, trim_whitespace
+
+
+@pytest.fixture(scope="module")
+def large_numeric_df():
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        rng.integers(0, 1000, size=(100_000, 3)), columns=["a", "b", "c"]
+    )
+
+
+@pytest.fixture(scope="module")
+def large_text_df():
+    rng = np.random.default_rng(42)
+    tokens = np.array(["  alpha  ", "beta", " gamma", "delta  "], dtype=object)
+    return pd.DataFrame(
+        {
+            "text": tokens[rng.integers(0, len(tokens), size=100_000)],
+            "num": rng.integers(0, 1000, size=100_000),
+        }
+    )
+
+
+@pytest.mark.benchmark(group="dedupe")
+def test_find_duplicates_large(benchmark, large_numeric_df):
+    result = benchmark(find_duplicates, large_numeric_df, column=["a", "b"], counts=True)
+    assert not result.empty
+
+
+@pytest.mark.benchmark(group="trim")
+def test_trim_whitespace_large(benchmark, large_text_df):
+    result = benchmark(trim_whitespace, large_text_df)
+    assert not result["text"].str.startswith(" ").any()
+
+
+@pytest.fixture(scope="module")
+def large_mixed_df():
+    # Built in C via concatenate/repeat rather than a Python list
+    # comprehension; the stray strings exercise the object-column audit path.
+    mostly_int = np.concatenate(
+        [np.arange(99_000, dtype=object), np.repeat(np.array(["oops"], dtype=object), 1_000)]
+    )
+    return pd.DataFrame({"mostly_int": mostly_int})
+
+
+@pytest.mark.benchmark(group="audit")
+def test_audit_dataframe_mixed_large(benchmark, large_mixed_df):
+    issues = benchmark(
+        audit_dataframe, large_mixed_df, expected_dtypes={"mostly_int": "int64"}
+    )
+    assert (issues["issue"] == "dtype_mismatch").any()
+
+
+@pytest.mark.benchmark(group="audit")
+def test_audit_dataframe_large(benchmark, large_numeric_df):
+    issues = benchmark(
+        audit_dataframe,
+        large_numeric_df,
+        expected_dtypes={"a": "int64", "b": "float64"},
+        allow_nulls={"c": False},
+    )
+    assert issues.empty
@@ -1,8 +1,4 @@
 import importlib.util
-import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 import analysta
 
@@ -22,11 +18,14 @@ def test_all_exports():
         "duplicates",
         "find_duplicates",
         "audit_dataframe",
+        "compile_audit",
         "expect_df",
         "read_csv",
         "write_csv",
         "read_excel",
         "write_excel",
+        "read_parquet",
+        "write_parquet",
     }
     assert set(analysta.__all__) == expected
     for name in expected:
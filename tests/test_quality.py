@@ -1,19 +1,34 @@
 from __future__ import annotations
 
-import os
-import sys
-
+import numpy as np
 import pandas as pd
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
-from analysta import audit_dataframe
-
-
-def test_audit_dataframe_flags_forbidden_nulls() -> None:
-    df = pd.DataFrame({"id": [1, 2, 3], "value": [10, None, 30]})
-
-    issues = audit_dataframe(df, allow_nulls={"value": False})
+import pytest
+
+from analysta import audit_dataframe, compile_audit
+
+
+# The auditor never mutates its input, so every scenario frame is built once
+# per module and shared; tests pull the one they need by name.
+@pytest.fixture(scope="module")
+def audit_scenarios() -> dict[str, pd.DataFrame]:
+    return {
+        "nulls": pd.DataFrame(
+            {"id": np.array([1, 2, 3], dtype=np.int64), "value": [10, None, 30]}
+        ),
+        "null_tokens": pd.DataFrame({"value": ["ND", "ok"]}),
+        "tokens_permitted": pd.DataFrame({"value": ["NA", "10"]}),
+        "types": pd.DataFrame(
+            {
+                "int_col": [1, 2.5, "3", "bad"],
+                "float_col": [0.1, "0.2", "oops", 4],
+            }
+        ),
+        "dates": pd.DataFrame({"date": ["2024-01-01", "01/02/2024", "31-12-2023"]}),
+    }
+
+
+def test_audit_dataframe_flags_forbidden_nulls(audit_scenarios) -> None:
+    issues = audit_dataframe(audit_scenarios["nulls"], allow_nulls={"value": False})
 
     assert not issues.empty
     null_issue = issues[issues["issue"] == "null_forbidden"].iloc[0]
@@ -22,34 +37,31 @@ def test_audit_dataframe_flags_forbidden_nulls() -> None:
     assert "1" in null_issue["details"]  # index of the null value
 
 
-def test_audit_dataframe_flags_missing_value_tokens_when_nulls_forbidden() -> None:
-    df = pd.DataFrame({"value": ["ND", "ok"]})
-
-    issues = audit_dataframe(df, allow_nulls={"value": False})
+def test_audit_dataframe_flags_missing_value_tokens_when_nulls_forbidden(
+    audit_scenarios,
+) -> None:
+    issues = audit_dataframe(
+        audit_scenarios["null_tokens"], allow_nulls={"value": False}
+    )
 
     assert "null_forbidden" in issues["issue"].values
     null_issue = issues[issues["issue"] == "null_forbidden"].iloc[0]
     assert "0" in null_issue["details"]
 
 
-def test_audit_dataframe_allows_missing_value_tokens_when_nulls_permitted() -> None:
-    df = pd.DataFrame({"value": ["NA", "10"]})
-
-    issues = audit_dataframe(df, allow_nulls={"value": True})
+def test_audit_dataframe_allows_missing_value_tokens_when_nulls_permitted(
+    audit_scenarios,
+) -> None:
+    issues = audit_dataframe(
+        audit_scenarios["tokens_permitted"], allow_nulls={"value": True}
+    )
 
     assert issues.empty
 
 
-def test_audit_dataframe_detects_type_mismatches() -> None:
-    df = pd.DataFrame(
-        {
-            "int_col": [1, 2.5, "3", "bad"],
-            "float_col": [0.1, "0.2", "oops", 4],
-        }
-    )
-
+def test_audit_dataframe_detects_type_mismatches(audit_scenarios) -> None:
     issues = audit_dataframe(
-        df,
+        audit_scenarios["types"],
         expected_dtypes={"int_col": "int64", "float_col": "float64"},
     )
 
@@ -63,25 +75,34 @@ def test_audit_dataframe_detects_type_mismatches() -> None:
     assert "oops" in float_issue["details"]
 
 
-def test_audit_dataframe_validates_date_formats() -> None:
-    df = pd.DataFrame(
-        {
-            "date": ["2024-01-01", "01/02/2024", "31-12-2023"],
-        }
+def test_audit_dataframe_validates_date_formats(audit_scenarios) -> None:
+    issues = audit_dataframe(
+        audit_scenarios["dates"], date_formats={"date": ["%Y-%m-%d", "%m/%d/%Y"]}
     )
 
-    issues = audit_dataframe(df, date_formats={"date": ["%Y-%m-%d", "%m/%d/%Y"]})
-
     assert "invalid_date_format" in issues["issue"].values
     date_issue = issues[issues["issue"] == "invalid_date_format"].iloc[0]
     assert date_issue["column"] == "date"
     assert "31-12-2023" in date_issue["details"]
 
 
+def test_compile_audit_reuses_schema_across_frames() -> None:
+    checker = compile_audit(
+        allow_nulls={"value": False},
+        expected_dtypes={"value": "int64"},
+    )
+
+    clean = checker(pd.DataFrame({"value": np.array([1, 2, 3], dtype=np.int64)}))
+    dirty = checker(pd.DataFrame({"value": [1, None, 2.5]}))
+
+    assert clean.empty
+    assert {"null_forbidden", "dtype_mismatch"} == set(dirty["issue"])
+
+
 def test_audit_dataframe_flags_numeric_outliers() -> None:
-    in_range = [10] * 95
-    outliers = [100] * 5
-    df = pd.DataFrame({"metric": in_range + outliers})
+    metric = np.full(100, 10, dtype=np.int64)
+    metric[95:] = 100
+    df = pd.DataFrame({"metric": metric})
 
     issues = audit_dataframe(
         df,
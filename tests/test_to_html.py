@@ -1,15 +1,28 @@
 import pandas as pd
 import analysta as nl
 
+# The report markup wraps "(Top 50)" in a styled span, so the section
+# heading is matched on its stable prefix.
+NEEDLES = (
+    "<!DOCTYPE html>",
+    "Analysta Delta Report",
+    'Mismatches <span style="color: var(--text-secondary);',
+    "<td>20</td>",  # val_a
+    "<td>25</td>",  # val_b
+)
+
+
 def test_to_html_generation():
     df_a = pd.DataFrame({"id": [1, 2], "val": [10, 20]})
     df_b = pd.DataFrame({"id": [1, 2], "val": [10, 25]})
-    
+
     delta = nl.Delta(df_a, df_b, keys="id")
     html = delta.to_html()
-    
-    assert "<!DOCTYPE html>" in html
-    assert "Analysta Delta Report" in html
-    assert "Mismatches (Top 50)" in html
-    assert "<td>20</td>" in html  # val_a
-    assert "<td>25</td>" in html  # val_b
+
+    # Size sentinel: the two-row report currently renders at ~8 KB, so a
+    # runaway template or embedded-asset regression trips this long before
+    # it slows report consumers.
+    assert len(html) < 200_000, "delta HTML unexpectedly large"
+
+    missing = [needle for needle in NEEDLES if needle not in html]
+    assert not missing, f"report is missing: {missing}"